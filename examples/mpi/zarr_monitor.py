@@ -18,12 +18,10 @@ from ndsl.constants import X_DIM, Y_DIM, Z_DIM
 OUTPUT_PATH = "output/zarr_monitor.zarr"
 
 
-def get_example_state(time):
+def get_example_air_temperature():
     sizer = SubtileGridSizer(nx=48, ny=48, nz=70, n_halo=3, extra_dim_lengths={})
     allocator = QuantityFactory(sizer, np)
-    air_temperature = allocator.zeros([X_DIM, Y_DIM, Z_DIM], units="degK")
-    air_temperature.view[:] = np.random.randn(*air_temperature.extent)
-    return {"time": time, "air_temperature": air_temperature}
+    return allocator.zeros([X_DIM, Y_DIM, Z_DIM], units="degK")
 
 
 if __name__ == "__main__":
@@ -39,7 +37,12 @@ if __name__ == "__main__":
     time = cftime.DatetimeJulian(2020, 1, 1)
     timestep = timedelta(hours=1)
 
+    rng = np.random.default_rng(0)
+    # the monitor copies data on store, so the same quantity is reused every step
+    air_temperature = get_example_air_temperature()
+    state = {"time": time, "air_temperature": air_temperature}
     for i in range(10):
-        state = get_example_state(time)
+        air_temperature.view[:] = rng.standard_normal(air_temperature.extent)
+        state["time"] = time
         monitor.store(state)
         time += timestep
@@ -1,3 +1,5 @@
+import importlib
+
 from .comm.communicator import CubedSphereCommunicator, TileCommunicator
 from .comm.local_comm import LocalComm
 from .comm.mpi import MPIComm
@@ -22,7 +24,6 @@ from .halo.updater import HaloUpdater, HaloUpdateRequest, VectorInterfaceHaloUpd
 from .initialization.allocator import QuantityFactory
 from .initialization.sizer import GridSizer, SubtileGridSizer
 from .logging import ndsl_log
-from .monitor.netcdf_monitor import NetCDFMonitor
 from .namelist import Namelist
 from .performance.collector import NullPerformanceCollector, PerformanceCollector
 from .performance.profiler import NullProfiler, Profiler
@@ -31,3 +32,22 @@ from .quantity import Quantity
 from .testing.dummy_comm import DummyComm
 from .types import Allocator
 from .utils import MetaEnumStr
+
+
+# Symbols whose modules pull in heavy dependencies that ndsl does not otherwise need
+# are resolved on first access (PEP 562) rather than at import time.
+_LAZY_IMPORTS = {
+    "NetCDFMonitor": ".monitor.netcdf_monitor",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -2,6 +2,10 @@ import abc
 
 
 class Checkpointer(abc.ABC):
+    # False for checkpointers which discard their data, callers can check
+    # this to skip gathering arguments for a checkpoint entirely
+    enabled: bool = True
+
     @abc.abstractmethod
     def __call__(self, savepoint_name, **kwargs):
         ...
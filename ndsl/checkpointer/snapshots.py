@@ -7,28 +7,61 @@ from ndsl.optional_imports import cupy as cp
 from ndsl.optional_imports import xarray as xr
 
 
-def make_dims(savepoint_dim, label, data_list):
+def make_dims(savepoint_dim, label, data):
     """
     Helper which defines dimension names for an xarray variable.
 
     Used to ensure no dimensions have the same name but different sizes
     when defining xarray datasets.
+
+    Args:
+        savepoint_dim: name of the leading savepoint dimension
+        label: variable name used to label the remaining dimensions
+        data: array of stacked snapshots, savepoints along the first axis
     """
-    data = np.concatenate([array[None, :] for array in data_list], axis=0)
-    dims = [savepoint_dim] + [f"{label}_dim{i}" for i in range(len(data.shape[1:]))]
-    if cp and isinstance(data, cp.ndarray):
-        data = data.get()
+    dims = [savepoint_dim] + [f"{label}_dim{i}" for i in range(data.ndim - 1)]
     return dims, data
 
 
 class _Snapshots:
     def __init__(self):
         self._savepoints = collections.defaultdict(list)
-        self._arrays = collections.defaultdict(list)
+        # stacked copies of each variable, savepoints along the first axis,
+        # with capacity doubled whenever it is exhausted
+        self._arrays = {}
 
     def store(self, savepoint_name: str, variable_name: str, python_data):
+        # device data is moved to the host as it is stored, one snapshot at a time
+        if cp and isinstance(python_data, cp.ndarray):
+            python_data = cp.asnumpy(python_data)
+        else:
+            python_data = np.asarray(python_data)
+        n_stored = len(self._savepoints[variable_name])
+        buffer = self._arrays.get(variable_name)
+        if buffer is not None and buffer.shape[1:] != python_data.shape:
+            raise ValueError(
+                f"shape {python_data.shape} of {variable_name} does not match "
+                f"previously stored shape {buffer.shape[1:]}"
+            )
+        if buffer is not None and buffer.dtype != python_data.dtype:
+            raise ValueError(
+                f"dtype {python_data.dtype} of {variable_name} does not match "
+                f"previously stored dtype {buffer.dtype}"
+            )
+        if buffer is None or n_stored == buffer.shape[0]:
+            buffer = self._grow(buffer, n_stored, python_data)
+            self._arrays[variable_name] = buffer
+        buffer[n_stored] = python_data
         self._savepoints[variable_name].append(savepoint_name)
-        self._arrays[variable_name].append(python_data)
+
+    @staticmethod
+    def _grow(buffer, n_stored: int, python_data):
+        new_buffer = np.empty(
+            (max(1, 2 * n_stored),) + python_data.shape, dtype=python_data.dtype
+        )
+        if buffer is not None:
+            new_buffer[:n_stored] = buffer[:n_stored]
+        return new_buffer
 
     @property
     def dataset(self) -> "xr.Dataset":
@@ -37,7 +70,9 @@ class _Snapshots:
             savepoint_dim = f"sp_{variable_name}"
             data_vars[f"{variable_name}_savepoints"] = ([savepoint_dim], savepoint_list)
             data_vars[f"{variable_name}"] = make_dims(
-                savepoint_dim, variable_name, self._arrays[variable_name]
+                savepoint_dim,
+                variable_name,
+                self._arrays[variable_name][: len(savepoint_list)],
             )
         if xr is None:
             raise ModuleNotFoundError(
@@ -63,8 +98,7 @@ class SnapshotCheckpointer(Checkpointer):
 
     def __call__(self, savepoint_name, **kwargs):
         for name, value in kwargs.items():
-            array_data = np.copy(value.data)
-            self._snapshots.store(savepoint_name, name, array_data)
+            self._snapshots.store(savepoint_name, name, value.data)
 
     @property
     def dataset(self) -> "xr.Dataset":
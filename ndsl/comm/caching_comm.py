@@ -1,4 +1,3 @@
-import copy
 import dataclasses
 import pickle
 from typing import Any, BinaryIO, List, Optional, TypeVar
@@ -6,12 +5,27 @@ from typing import Any, BinaryIO, List, Optional, TypeVar
 import numpy as np
 
 from ndsl.comm.comm_abc import Comm, ReductionOperator, Request
+from ndsl.optional_imports import cupy as cp
+from ndsl.utils import copy_buffer
 
 
 T = TypeVar("T")
 
 
+def _copy_object(obj):
+    """Copy an object returned by a pickle-based collective (bcast, allreduce).
+
+    Such objects are picklable by construction, and a pickle round-trip is much
+    cheaper than copy.deepcopy for the nested containers typically exchanged.
+    """
+    if isinstance(obj, np.ndarray) or (cp and isinstance(obj, cp.ndarray)):
+        return copy_buffer(obj)
+    return pickle.loads(pickle.dumps(obj, protocol=5))
+
+
 class CachingRequestWriter(Request):
+    __slots__ = ("_req", "_buffer", "_buffer_list")
+
     def __init__(self, req: Request, buffer: np.ndarray, buffer_list: List[np.ndarray]):
         self._req = req
         self._buffer = buffer
@@ -19,10 +33,12 @@ class CachingRequestWriter(Request):
 
     def wait(self):
         self._req.wait()
-        self._buffer_list.append(copy.deepcopy(self._buffer))
+        self._buffer_list.append(copy_buffer(self._buffer))
 
 
 class CachingRequestReader(Request):
+    __slots__ = ("_recvbuf", "_data")
+
     def __init__(self, recvbuf, data):
         self._recvbuf = recvbuf
         self._data = data
@@ -32,10 +48,16 @@ class CachingRequestReader(Request):
 
 
 class NullRequest(Request):
+    __slots__ = ()
+
     def wait(self):
         pass
 
 
+# NullRequest is stateless, a single instance is shared by all replayed sends
+_NULL_REQUEST = NullRequest()
+
+
 @dataclasses.dataclass
 class CachingCommData:
     """
@@ -79,7 +101,9 @@ class CachingCommData:
         return return_value
 
     def dump(self, file: BinaryIO):
-        pickle.dump(self, file)
+        # protocol 5 lets numpy write array memory straight to the file (PEP 574)
+        # instead of first copying it into an intermediate bytes object
+        pickle.dump(self, file, protocol=5)
 
     @classmethod
     def load(self, file: BinaryIO) -> "CachingCommData":
@@ -132,7 +156,7 @@ class CachingCommReader(Comm):
         pass
 
     def Isend(self, sendbuf, dest, tag: int = 0, **kwargs) -> Request:
-        return NullRequest()
+        return _NULL_REQUEST
 
     def Recv(self, recvbuf, source, tag: int = 0, **kwargs):
         recvbuf[:] = self._data.get_buffer()
@@ -147,7 +171,7 @@ class CachingCommReader(Comm):
         new_data = self._data.get_split()
         return CachingCommReader(data=new_data)
 
-    def allreduce(self, sendobj, op: Optional[ReductionOperator] = None) -> Any:
+    def allreduce(self, sendobj, op: ReductionOperator) -> Any:
         return self._data.get_generic_obj()
 
     def Allreduce(self, sendobj, recvobj, op: ReductionOperator) -> Any:
@@ -184,7 +208,7 @@ class CachingCommWriter(Comm):
 
     def bcast(self, value: Optional[T], root=0) -> T:
         result = self._comm.bcast(value=value, root=root)
-        self._data.bcast_objects.append(copy.deepcopy(result))
+        self._data.bcast_objects.append(_copy_object(result))
         return result
 
     def barrier(self):
@@ -195,11 +219,11 @@ class CachingCommWriter(Comm):
 
     def Scatter(self, sendbuf, recvbuf, root=0, **kwargs):
         self._comm.Scatter(sendbuf=sendbuf, recvbuf=recvbuf, root=root, **kwargs)
-        self._data.received_buffers.append(copy.deepcopy(recvbuf))
+        self._data.received_buffers.append(copy_buffer(recvbuf))
 
     def Gather(self, sendbuf, recvbuf, root=0, **kwargs):
         self._comm.Gather(sendbuf=sendbuf, recvbuf=recvbuf, root=root, **kwargs)
-        self._data.received_buffers.append(copy.deepcopy(recvbuf))
+        self._data.received_buffers.append(copy_buffer(recvbuf))
 
     def allgather(self, sendobj):
         raise NotImplementedError("allgather not yet implemented for CachingCommReader")
@@ -212,7 +236,7 @@ class CachingCommWriter(Comm):
 
     def Recv(self, recvbuf, source, tag: int = 0, **kwargs):
         self._comm.Recv(recvbuf=recvbuf, source=source, tag=tag, **kwargs)
-        self._data.received_buffers.append(copy.deepcopy(recvbuf))
+        self._data.received_buffers.append(copy_buffer(recvbuf))
 
     def Irecv(self, recvbuf, source, tag: int = 0, **kwargs) -> Request:
         req = self._comm.Irecv(recvbuf, source, tag=tag, **kwargs)
@@ -232,9 +256,9 @@ class CachingCommWriter(Comm):
     def dump(self, file: BinaryIO):
         self._data.dump(file)
 
-    def allreduce(self, sendobj, op: Optional[ReductionOperator] = None) -> Any:
+    def allreduce(self, sendobj, op: ReductionOperator) -> Any:
         result = self._comm.allreduce(sendobj, op)
-        self._data.generic_obj_buffers.append(copy.deepcopy(result))
+        self._data.generic_obj_buffers.append(_copy_object(result))
         return result
 
     def Allreduce(self, sendobj, recvobj, op: ReductionOperator) -> Any:
@@ -7,7 +7,7 @@ T = TypeVar("T")
 
 
 @enum.unique
-class ReductionOperator(enum.Enum):
+class ReductionOperator(enum.IntEnum):
     OP_NULL = enum.auto()
     MAX = enum.auto()
     MIN = enum.auto()
@@ -26,12 +26,16 @@ class ReductionOperator(enum.Enum):
 
 
 class Request(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def wait(self):
         ...
 
 
 class Comm(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def Get_rank(self) -> int:
         ...
@@ -89,7 +93,7 @@ class Comm(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def allreduce(self, sendobj: T, op: Optional[ReductionOperator] = None) -> T:
+    def allreduce(self, sendobj: T, op: ReductionOperator) -> T:
         ...
 
     @abc.abstractmethod
@@ -10,17 +10,12 @@ from ndsl.comm.comm_abc import Comm as CommABC
 from ndsl.comm.comm_abc import ReductionOperator
 from ndsl.comm.partitioner import CubedSpherePartitioner, Partitioner, TilePartitioner
 from ndsl.halo.updater import HaloUpdater, HaloUpdateRequest, VectorInterfaceHaloUpdater
+from ndsl.optional_imports import cupy
 from ndsl.performance.timer import NullTimer, Timer
 from ndsl.quantity import Quantity, QuantityHaloSpec, QuantityMetadata
 from ndsl.types import NumpyModule
 
 
-try:
-    import cupy
-except ImportError:
-    cupy = None
-
-
 def to_numpy(array, dtype=None) -> np.ndarray:
     """
     Input array can be a numpy array or a cupy array. Returns numpy array.
@@ -217,9 +212,12 @@ class Communicator(abc.ABC):
     def _get_gather_recv_quantity(
         self, global_extent: Sequence[int], send_metadata: QuantityMetadata
     ) -> Quantity:
-        """Initialize a Quantity for use when receiving global data during gather"""
+        """Initialize a Quantity for use when receiving global data during gather
+
+        Data is left uninitialized, every subtile of it is written by the gather.
+        """
         recv_quantity = Quantity(
-            send_metadata.np.zeros(global_extent, dtype=send_metadata.dtype),
+            send_metadata.np.empty(global_extent, dtype=send_metadata.dtype),
             dims=send_metadata.dims,
             units=send_metadata.units,
             origin=tuple([0 for dim in send_metadata.dims]),
@@ -232,9 +230,12 @@ class Communicator(abc.ABC):
     def _get_scatter_recv_quantity(
         self, shape: Sequence[int], send_metadata: QuantityMetadata
     ) -> Quantity:
-        """Initialize a Quantity for use when receiving subtile data during scatter"""
+        """Initialize a Quantity for use when receiving subtile data during scatter
+
+        Data is left uninitialized, all of it is written by the scatter.
+        """
         recv_quantity = Quantity(
-            send_metadata.np.zeros(shape, dtype=send_metadata.dtype),
+            send_metadata.np.empty(shape, dtype=send_metadata.dtype),
             dims=send_metadata.dims,
             units=send_metadata.units,
             gt4py_backend=send_metadata.gt4py_backend,
@@ -352,25 +353,26 @@ class Communicator(abc.ABC):
             name_list = list(send_state.keys())
             while "time" in name_list:
                 name_list.remove("time")
-            name_list = self.comm.bcast(name_list, root=constants.ROOT_RANK)
+            # names and time share a single broadcast
+            name_list, recv_state["time"] = self.comm.bcast(
+                (name_list, send_state.get("time", None)), root=constants.ROOT_RANK
+            )
             array_list = [send_state[name] for name in name_list]
             for name, array in zip(name_list, array_list):
                 if name in recv_state:
                     self.scatter(send_quantity=array, recv_quantity=recv_state[name])
                 else:
                     recv_state[name] = self.scatter(send_quantity=array)
-            recv_state["time"] = self.comm.bcast(
-                send_state.get("time", None), root=constants.ROOT_RANK
-            )
 
         def scatter_client():
-            name_list = self.comm.bcast(None, root=constants.ROOT_RANK)
+            name_list, recv_state["time"] = self.comm.bcast(
+                None, root=constants.ROOT_RANK
+            )
             for name in name_list:
                 if name in recv_state:
                     self.scatter(recv_quantity=recv_state[name])
                 else:
                     recv_state[name] = self.scatter()
-            recv_state["time"] = self.comm.bcast(None, root=constants.ROOT_RANK)
 
         if recv_state is None:
             recv_state = {}
@@ -636,9 +638,18 @@ def bcast_metadata(comm, array):
     return bcast_metadata_list(comm, [array])[0]
 
 
+_SMALL_LAYOUT_HALO_MESSAGE = (
+    "implementing halo updates on smaller layouts requires "
+    "refactoring our code to remove the assumption that any pair "
+    "of ranks only share one boundary"
+)
+
+
 class TileCommunicator(Communicator):
     """Performs communications within a single tile or region of a tile"""
 
+    partitioner: TilePartitioner
+
     def __init__(
         self,
         comm,
@@ -657,7 +668,7 @@ class TileCommunicator(Communicator):
         super(TileCommunicator, self).__init__(
             comm, partitioner, force_cpu=force_cpu, timer=timer
         )
-        self.partitioner: TilePartitioner = partitioner
+        self._small_layout = partitioner.layout[0] < 3 or partitioner.layout[1] < 3
 
     @classmethod
     def from_layout(
@@ -686,12 +697,8 @@ class TileCommunicator(Communicator):
         Returns:
             request: an asynchronous request object with a .wait() method
         """
-        if self.partitioner.layout[0] < 3 or self.partitioner.layout[1] < 3:
-            raise NotImplementedError(
-                "implementing halo updates on smaller layouts requires "
-                "refactoring our code to remove the assumption that any pair "
-                "of ranks only share one boundary"
-            )
+        if self._small_layout:
+            raise NotImplementedError(_SMALL_LAYOUT_HALO_MESSAGE)
         else:
             return super().start_halo_update(quantity, n_points)
 
@@ -713,12 +720,8 @@ class TileCommunicator(Communicator):
         Returns:
             request: an asynchronous request object with a .wait() method
         """
-        if self.partitioner.layout[0] < 3 or self.partitioner.layout[1] < 3:
-            raise NotImplementedError(
-                "implementing halo updates on smaller layouts requires "
-                "refactoring our code to remove the assumption that any pair "
-                "of ranks only share one boundary"
-            )
+        if self._small_layout:
+            raise NotImplementedError(_SMALL_LAYOUT_HALO_MESSAGE)
         else:
             return super().start_vector_halo_update(x_quantity, y_quantity, n_points)
 
@@ -743,12 +746,8 @@ class TileCommunicator(Communicator):
         Returns:
             request: an asynchronous request object with a .wait() method
         """
-        if self.partitioner.layout[0] < 3 or self.partitioner.layout[1] < 3:
-            raise NotImplementedError(
-                "implementing halo updates on smaller layouts requires "
-                "refactoring our code to remove the assumption that any pair "
-                "of ranks only share one boundary"
-            )
+        if self._small_layout:
+            raise NotImplementedError(_SMALL_LAYOUT_HALO_MESSAGE)
         else:
             return super().start_synchronize_vector_interfaces(x_quantity, y_quantity)
 
@@ -786,11 +785,9 @@ class CubedSphereCommunicator(Communicator):
                 "with mpi and the correct number of ranks?"
             )
         self._tile_communicator: Optional[TileCommunicator] = None
-        self._force_cpu = force_cpu
         super(CubedSphereCommunicator, self).__init__(
             comm, partitioner, force_cpu, timer
         )
-        self.partitioner: CubedSpherePartitioner = partitioner
 
     @classmethod
     def from_layout(
@@ -824,11 +821,13 @@ class CubedSphereCommunicator(Communicator):
         Args:
             shape: ndarray shape, numpy-style
             metadata: metadata to the created Quantity
+
+        Data is left uninitialized, every tile of it is written by the gather.
         """
         # needs to change the quantity dimensions since we add a "tile" dimension,
         # unlike for tile scatter/gather which retains the same dimensions
         recv_quantity = Quantity(
-            metadata.np.zeros(global_extent, dtype=metadata.dtype),
+            metadata.np.empty(global_extent, dtype=metadata.dtype),
             dims=(constants.TILE_DIM,) + metadata.dims,
             units=metadata.units,
             origin=(0,) + tuple([0 for dim in metadata.dims]),
@@ -846,11 +845,13 @@ class CubedSphereCommunicator(Communicator):
         Args:
             shape: ndarray shape, numpy-style
             metadata: metadata to the created Quantity
+
+        Data is left uninitialized, all of it is written by the scatter.
         """
         # needs to change the quantity dimensions since we remove a "tile" dimension,
         # unlike for tile scatter/gather which retains the same dimensions
         recv_quantity = Quantity(
-            metadata.np.zeros(shape, dtype=metadata.dtype),
+            metadata.np.empty(shape, dtype=metadata.dtype),
             dims=metadata.dims[1:],
             units=metadata.units,
             gt4py_backend=metadata.gt4py_backend,
@@ -1,9 +1,9 @@
-import copy
+import collections
 from typing import Any
 
 from ndsl.comm.comm_abc import Comm
 from ndsl.logging import ndsl_log
-from ndsl.utils import ensure_contiguous, safe_assign_array
+from ndsl.utils import copy_buffer, ensure_contiguous, safe_assign_array
 
 
 class ConcurrencyError(Exception):
@@ -14,6 +14,8 @@ class ConcurrencyError(Exception):
 
 
 class AsyncResult:
+    __slots__ = ("_result",)
+
     def __init__(self, result):
         self._result = result
 
@@ -22,6 +24,8 @@ class AsyncResult:
 
 
 class LocalComm(Comm):
+    __slots__ = ("rank", "total_ranks", "_buffer", "_i_buffer")
+
     def __init__(self, rank, total_ranks, buffer_dict):
         self.rank = rank
         self.total_ranks = total_ranks
@@ -67,14 +71,16 @@ class LocalComm(Comm):
                 f"rank-specific buffer not initialized for send_recv, likely "
                 f"recv called before send from rank {from_rank} to rank {self.rank}"
             )
-        return_value = self._buffer["send_recv"][key].pop(0)
+        return_value = self._buffer["send_recv"][key].popleft()
         return return_value
 
     def _put_send_recv(self, value, to_rank, tag: int):
         key = (self.rank, to_rank, tag)
         self._buffer["send_recv"] = self._buffer.get("send_recv", {})
-        self._buffer["send_recv"][key] = self._buffer["send_recv"].get(key, [])
-        self._buffer["send_recv"][key].append(copy.deepcopy(value))
+        # messages are consumed in order, a deque makes popping the oldest O(1)
+        self._buffer["send_recv"].setdefault(key, collections.deque()).append(
+            copy_buffer(value)
+        )
 
     @property
     def _bcast_buffer(self):
@@ -119,7 +125,7 @@ class LocalComm(Comm):
                 "the scatter source"
             )
         if sendbuf is not None:
-            sendbuf = self._get_buffer("scatter", copy.deepcopy(sendbuf))
+            sendbuf = self._get_buffer("scatter", copy_buffer(sendbuf))
         else:
             sendbuf = self._get_buffer("scatter", None)
         safe_assign_array(recvbuf, sendbuf[self.rank])
@@ -128,7 +134,7 @@ class LocalComm(Comm):
         ensure_contiguous(sendbuf)
         ensure_contiguous(recvbuf)
         gather_buffer = self._gather_buffer
-        gather_buffer[self.rank] = copy.deepcopy(sendbuf)
+        gather_buffer[self.rank] = copy_buffer(sendbuf)
         if self.rank == root:
             # ndarrays are finnicky, have to check for None like this:
             if any(item is None for item in gather_buffer):
@@ -5,6 +5,8 @@ except ImportError:
     MPI = None
 from typing import Dict, List, Optional, TypeVar, cast
 
+import numpy as np
+
 from ndsl.comm.comm_abc import Comm, ReductionOperator, Request
 from ndsl.logging import ndsl_log
 
@@ -12,7 +14,44 @@ from ndsl.logging import ndsl_log
 T = TypeVar("T")
 
 
+# dtype kinds MPI defines each predefined reduction on, everything else is
+# left to the pickle-based reduction
+_BUFFER_REDUCTION_KINDS: Dict[ReductionOperator, str] = {
+    ReductionOperator.SUM: "iufc",
+    ReductionOperator.PROD: "iufc",
+    ReductionOperator.MAX: "iuf",
+    ReductionOperator.MIN: "iuf",
+    ReductionOperator.LAND: "iu",
+    ReductionOperator.LOR: "iu",
+    ReductionOperator.LXOR: "iu",
+    ReductionOperator.BAND: "iu",
+    ReductionOperator.BOR: "iu",
+    ReductionOperator.BXOR: "iu",
+}
+
+# the pickled logical reductions of scalars return a bool, while MPI returns
+# 0 or 1 in the operand's integer type
+_SCALAR_LOGICAL_OPERATORS = frozenset(
+    (ReductionOperator.LAND, ReductionOperator.LOR, ReductionOperator.LXOR)
+)
+
+
+def _is_reducible(dtype: np.dtype, op: ReductionOperator) -> bool:
+    """True if MPI can reduce buffers of this dtype with the given operator.
+
+    MPI has no arithmetic on bool, and half and extended precision floats are not
+    portable MPI datatypes, so those are left to the pickle-based reduction.
+    """
+    return (
+        dtype.kind in _BUFFER_REDUCTION_KINDS.get(op, "")
+        and dtype.char not in "egG"
+        and dtype.char in MPI._typedict
+    )
+
+
 class MPIComm(Comm):
+    __slots__ = ("_comm", "_rank", "_size")
+
     _op_mapping: Dict[ReductionOperator, mpi4py.MPI.Op] = {
         ReductionOperator.OP_NULL: mpi4py.MPI.OP_NULL,
         ReductionOperator.MAX: mpi4py.MPI.MAX,
@@ -31,82 +70,116 @@ class MPIComm(Comm):
         ReductionOperator.NO_OP: mpi4py.MPI.NO_OP,
     }
 
-    def __init__(self):
+    def __init__(self, comm=None):
+        """
+        Args:
+            comm: mpi4py communicator to wrap, defaults to MPI.COMM_WORLD
+        """
         if MPI is None:
             raise RuntimeError("MPI not available")
-        self._comm: Comm = cast(Comm, MPI.COMM_WORLD)
+        self._comm: mpi4py.MPI.Comm = MPI.COMM_WORLD if comm is None else comm
+        # rank and size of a communicator are fixed for its whole life
+        self._rank = self._comm.Get_rank()
+        self._size = self._comm.Get_size()
 
     def Get_rank(self) -> int:
-        return self._comm.Get_rank()
+        return self._rank
 
     def Get_size(self) -> int:
-        return self._comm.Get_size()
+        return self._size
 
     def bcast(self, value: Optional[T], root=0) -> T:
-        ndsl_log.debug("bcast from root %s on rank %s", root, self._comm.Get_rank())
+        ndsl_log.debug("bcast from root %s on rank %s", root, self._rank)
         return self._comm.bcast(value, root=root)
 
     def barrier(self):
-        ndsl_log.debug("barrier on rank %s", self._comm.Get_rank())
+        ndsl_log.debug("barrier on rank %s", self._rank)
         self._comm.barrier()
 
     def Barrier(self):
-        pass
+        ndsl_log.debug("Barrier on rank %s", self._rank)
+        self._comm.Barrier()
+
+    def Ibarrier(self) -> Request:
+        ndsl_log.debug("Ibarrier on rank %s", self._rank)
+        return cast(Request, self._comm.Ibarrier())
 
     def Scatter(self, sendbuf, recvbuf, root=0, **kwargs):
-        ndsl_log.debug("Scatter on rank %s with root %s", self._comm.Get_rank(), root)
+        ndsl_log.debug("Scatter on rank %s with root %s", self._rank, root)
         self._comm.Scatter(sendbuf, recvbuf, root=root, **kwargs)
 
     def Gather(self, sendbuf, recvbuf, root=0, **kwargs):
-        ndsl_log.debug("Gather on rank %s with root %s", self._comm.Get_rank(), root)
+        ndsl_log.debug("Gather on rank %s with root %s", self._rank, root)
         self._comm.Gather(sendbuf, recvbuf, root=root, **kwargs)
 
     def allgather(self, sendobj: T) -> List[T]:
-        ndsl_log.debug("allgather on rank %s", self._comm.Get_rank())
+        ndsl_log.debug("allgather on rank %s", self._rank)
         return self._comm.allgather(sendobj)
 
     def Send(self, sendbuf, dest, tag: int = 0, **kwargs):
-        ndsl_log.debug("Send on rank %s with dest %s", self._comm.Get_rank(), dest)
+        ndsl_log.debug("Send on rank %s with dest %s", self._rank, dest)
         self._comm.Send(sendbuf, dest, tag=tag, **kwargs)
 
     def sendrecv(self, sendbuf, dest, **kwargs):
-        ndsl_log.debug("sendrecv on rank %s with dest %s", self._comm.Get_rank(), dest)
+        ndsl_log.debug("sendrecv on rank %s with dest %s", self._rank, dest)
         return self._comm.sendrecv(sendbuf, dest, **kwargs)
 
     def Isend(self, sendbuf, dest, tag: int = 0, **kwargs) -> Request:
-        ndsl_log.debug("Isend on rank %s with dest %s", self._comm.Get_rank(), dest)
-        return self._comm.Isend(sendbuf, dest, tag=tag, **kwargs)
+        ndsl_log.debug("Isend on rank %s with dest %s", self._rank, dest)
+        return cast(Request, self._comm.Isend(sendbuf, dest, tag=tag, **kwargs))
 
     def Recv(self, recvbuf, source, tag: int = 0, **kwargs):
-        ndsl_log.debug("Recv on rank %s with source %s", self._comm.Get_rank(), source)
+        ndsl_log.debug("Recv on rank %s with source %s", self._rank, source)
         self._comm.Recv(recvbuf, source, tag=tag, **kwargs)
 
     def Irecv(self, recvbuf, source, tag: int = 0, **kwargs) -> Request:
-        ndsl_log.debug("Irecv on rank %s with source %s", self._comm.Get_rank(), source)
-        return self._comm.Irecv(recvbuf, source, tag=tag, **kwargs)
+        ndsl_log.debug("Irecv on rank %s with source %s", self._rank, source)
+        return cast(Request, self._comm.Irecv(recvbuf, source, tag=tag, **kwargs))
 
     def Split(self, color, key) -> "Comm":
-        ndsl_log.debug(
-            "Split on rank %s with color %s, key %s", self._comm.Get_rank(), color, key
-        )
-        return self._comm.Split(color, key)
-
-    def allreduce(self, sendobj: T, op: Optional[ReductionOperator] = None) -> T:
-        ndsl_log.debug(
-            "allreduce on rank %s with operator %s", self._comm.Get_rank(), op
-        )
+        ndsl_log.debug("Split on rank %s with color %s, key %s", self._rank, color, key)
+        return MPIComm(self._comm.Split(color, key))
+
+    def allreduce(self, sendobj: T, op: ReductionOperator) -> T:
+        ndsl_log.debug("allreduce on rank %s with operator %s", self._rank, op.name)
+        # reduce host arrays and numpy scalars through the buffer interface
+        # instead of pickling them
+        if (
+            isinstance(sendobj, np.generic)
+            and op not in _SCALAR_LOGICAL_OPERATORS
+            and _is_reducible(sendobj.dtype, op)
+        ):
+            return cast(T, self._buffer_allreduce(np.asarray(sendobj), op)[()])
+        if (
+            isinstance(sendobj, np.ndarray)
+            and _is_reducible(sendobj.dtype, op)
+            and sendobj.flags["C_CONTIGUOUS"]
+        ):
+            return cast(T, self._buffer_allreduce(sendobj, op))
         return self._comm.allreduce(sendobj, self._op_mapping[op])
 
+    def _buffer_allreduce(self, sendbuf: np.ndarray, op) -> np.ndarray:
+        recvbuf = np.empty_like(sendbuf)
+        self._comm.Allreduce(sendbuf, recvbuf, self._op_mapping[op])
+        return recvbuf
+
     def Allreduce(self, sendobj_or_inplace: T, recvobj: T, op: ReductionOperator) -> T:
-        ndsl_log.debug(
-            "Allreduce on rank %s with operator %s", self._comm.Get_rank(), op
+        ndsl_log.debug("Allreduce on rank %s with operator %s", self._rank, op.name)
+        self._comm.Allreduce(sendobj_or_inplace, recvobj, self._op_mapping[op])
+        return recvobj
+
+    def Iallreduce(self, sendobj: T, recvobj: T, op: ReductionOperator) -> Request:
+        # recvobj is only valid once the returned request has been waited on
+        ndsl_log.debug("Iallreduce on rank %s with operator %s", self._rank, op.name)
+        return cast(
+            Request, self._comm.Iallreduce(sendobj, recvobj, self._op_mapping[op])
         )
-        return self._comm.Allreduce(sendobj_or_inplace, recvobj, self._op_mapping[op])
 
     def Allreduce_inplace(self, recvobj: T, op: ReductionOperator) -> T:
         ndsl_log.debug(
             "Allreduce (in place) on rank %s with operator %s",
-            self._comm.Get_rank(),
-            op,
+            self._rank,
+            op.name,
         )
-        return self._comm.Allreduce(mpi4py.MPI.IN_PLACE, recvobj, self._op_mapping[op])
+        self._comm.Allreduce(mpi4py.MPI.IN_PLACE, recvobj, self._op_mapping[op])
+        return recvobj
@@ -1,16 +1,25 @@
-import copy
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping
 
 from ndsl.comm.comm_abc import Comm, ReductionOperator, Request
+from ndsl.utils import copy_buffer
+
+
+def _fill(recvbuf, fill_value):
+    # ndarray.fill skips the slice parsing of recvbuf[:] = fill_value
+    try:
+        recvbuf.fill(fill_value)
+    except AttributeError:
+        recvbuf[:] = fill_value
 
 
 class NullAsyncResult(Request):
-    def __init__(self, recvbuf=None):
+    def __init__(self, recvbuf=None, fill_value=0.0):
         self._recvbuf = recvbuf
+        self._fill_value = fill_value
 
     def wait(self):
         if self._recvbuf is not None:
-            self._recvbuf[:] = 0.0
+            _fill(self._recvbuf, self._fill_value)
 
 
 class NullComm(Comm):
@@ -50,16 +59,19 @@ class NullComm(Comm):
     def Barrier(self):
         return
 
+    def Ibarrier(self):
+        return NullAsyncResult()
+
     def Scatter(self, sendbuf, recvbuf, root=0, **kwargs):
         if recvbuf is not None:
-            recvbuf[:] = self._fill_value
+            _fill(recvbuf, self._fill_value)
 
     def Gather(self, sendbuf, recvbuf, root=0, **kwargs):
         if recvbuf is not None:
-            recvbuf[:] = self._fill_value
+            _fill(recvbuf, self._fill_value)
 
     def allgather(self, sendobj):
-        return [copy.deepcopy(sendobj) for _ in range(self.total_ranks)]
+        return [copy_buffer(sendobj) for _ in range(self.total_ranks)]
 
     def Send(self, sendbuf, dest, **kwargs):
         pass
@@ -68,10 +80,10 @@ class NullComm(Comm):
         return NullAsyncResult()
 
     def Recv(self, recvbuf, source, **kwargs):
-        recvbuf[:] = self._fill_value
+        _fill(recvbuf, self._fill_value)
 
     def Irecv(self, recvbuf, source, **kwargs):
-        return NullAsyncResult(recvbuf)
+        return NullAsyncResult(recvbuf, self._fill_value)
 
     def sendrecv(self, sendbuf, dest, **kwargs):
         return sendbuf
@@ -91,9 +103,12 @@ class NullComm(Comm):
         self._split_comms[color].append(new_comm)
         return new_comm
 
-    def allreduce(self, sendobj, op: Optional[ReductionOperator] = None) -> Any:
+    def allreduce(self, sendobj, op: ReductionOperator) -> Any:
         return self._fill_value
 
     def Allreduce(self, sendobj, recvobj, op: ReductionOperator) -> Any:
         recvobj = sendobj
         return recvobj
+
+    def Iallreduce(self, sendobj, recvobj, op: ReductionOperator):
+        return NullAsyncResult()
@@ -26,6 +26,20 @@ class RunMode(enum.Enum):
 
 
 class CompilationConfig:
+    __slots__ = (
+        "backend",
+        "rebuild",
+        "validate_args",
+        "format_source",
+        "device_sync",
+        "run_mode",
+        "use_minimal_caching",
+        "rank",
+        "size",
+        "compiling_equivalent",
+        "is_compiling",
+    )
+
     def __init__(
         self,
         backend: str = "numpy",
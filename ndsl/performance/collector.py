@@ -139,7 +139,6 @@ class PerformanceCollector(AbstractPerformanceCollector):
 
         self.times_per_step.append(self.total_timer.times)
         self.hits_per_step.append(self.total_timer.hits)
-        self.comm.Barrier()
         while {} in self.hits_per_step:
             self.hits_per_step.remove({})
         collect_data_and_write_to_file(
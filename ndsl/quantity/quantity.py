@@ -1,7 +1,6 @@
 import warnings
 from typing import Any, Iterable, Optional, Sequence, Tuple, Union, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 import ndsl.constants as constants
@@ -346,21 +345,35 @@ class Quantity:
         transposed._attrs = self._attrs
         return transposed
 
-    def plot_k_level(self, k_index=0):
-        field = self.data
+    def plot_k_level(self, k_index=0, path=None):
+        """Plot the data at vertical level k_index.
+
+        Args:
+            k_index: vertical level to plot
+            path: if given, save the figure to this path instead of showing it
+        """
+        import matplotlib.pyplot as plt
+
+        field = self.data[:, :, k_index]
+        if not isinstance(field, np.ndarray):
+            field = cupy.asnumpy(field)
         print(
             "Min and max values:",
-            field[:, :, k_index].min(),
-            field[:, :, k_index].max(),
+            field.min(),
+            field.max(),
         )
         plt.xlabel("I")
         plt.ylabel("J")
 
-        im = plt.imshow(field[:, :, k_index].transpose(), origin="lower")
+        im = plt.imshow(field.transpose(), origin="lower", interpolation="nearest")
 
         plt.colorbar(im)
         plt.title("Plot at K = " + str(k_index))
-        plt.show()
+        if path is None:
+            plt.show()
+        else:
+            plt.savefig(path)
+            plt.close()
 
 
 def _transpose_sequence(sequence, order):
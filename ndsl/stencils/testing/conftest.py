@@ -23,6 +23,10 @@ from ndsl.stencils.testing.savepoint import SavepointCase, dataset_to_dict
 from ndsl.stencils.testing.translate import TranslateGrid
 
 
+# libyaml's C loader when pyyaml was built with it, same safe subset of YAML
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def pytest_addoption(parser):
     """Option for the Translate Test system
 
@@ -127,7 +131,8 @@ def thresholds_from_file(config):
     thresholds_file = config.getoption("threshold_overrides_file")
     if thresholds_file is None:
         return None
-    return yaml.safe_load(open(thresholds_file, "r"))
+    with open(thresholds_file, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def get_test_class(test_name):
@@ -1,3 +1,4 @@
+import copy
 from enum import EnumMeta
 from typing import Iterable, Sequence, Tuple, TypeVar, Union
 
@@ -78,6 +79,17 @@ def safe_assign_array(to_array: np.ndarray, from_array: np.ndarray):
             raise
 
 
+def copy_buffer(buffer):
+    """Copy a communication buffer, avoiding the generic deepcopy path for arrays.
+
+    numpy and cupy arrays are copied on their own device, anything else
+    falls back to copy.deepcopy.
+    """
+    if isinstance(buffer, np.ndarray) or (cp and isinstance(buffer, cp.ndarray)):
+        return buffer.copy(order="K")
+    return copy.deepcopy(buffer)
+
+
 def device_synchronize():
     """Synchronize all memory communication"""
     if GPU_AVAILABLE:
@@ -57,3 +57,29 @@ def test_snapshot_checkpointer_multiple_snapshots():
             }
         ),
     )
+
+
+@requires_xarray
+def test_snapshot_checkpointer_copies_data():
+    checkpointer = SnapshotCheckpointer(rank=0)
+    val1 = np.random.randn(5, 3, 4)
+    data = np.empty((3, 4))
+    for i in range(val1.shape[0]):
+        data[:] = val1[i, :]
+        checkpointer(f"savepoint_name_{i}", val1=data)
+    data[:] = 0.0
+    np.testing.assert_array_equal(checkpointer.dataset["val1"].values, val1)
+
+
+def test_snapshot_checkpointer_rejects_shape_change():
+    checkpointer = SnapshotCheckpointer(rank=0)
+    checkpointer("savepoint_name_0", val1=np.zeros((3, 4)))
+    with pytest.raises(ValueError):
+        checkpointer("savepoint_name_1", val1=np.zeros((4, 3)))
+
+
+def test_snapshot_checkpointer_rejects_dtype_change():
+    checkpointer = SnapshotCheckpointer(rank=0)
+    checkpointer("savepoint_name_0", val1=np.zeros((3, 4), dtype=np.float64))
+    with pytest.raises(ValueError):
+        checkpointer("savepoint_name_1", val1=np.zeros((3, 4), dtype=np.float32))
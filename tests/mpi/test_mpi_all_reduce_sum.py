@@ -147,3 +147,87 @@ def test_all_reduce(communicator):
         assert (
             testQuantity_3D_out.data == (testQuantity_3D.data * communicator.size)
         ).all()
+
+
+@pytest.mark.skipif(
+    MPI is None, reason="mpi4py is not available or pytest was not run in parallel"
+)
+@pytest.mark.parametrize(
+    "sendobj",
+    [
+        np.arange(5, dtype=np.float64),
+        np.arange(5, dtype=np.int32),
+        np.arange(5, dtype=np.float16),
+        np.float64(1.5),
+        np.int32(2),
+        np.float16(0.5),
+        3,
+    ],
+)
+def test_mpi_comm_allreduce_sum(sendobj):
+    comm = MPIComm()
+    result = comm.allreduce(sendobj, ReductionOperator.SUM)
+    assert np.asarray(result).dtype == np.asarray(sendobj).dtype
+    np.testing.assert_array_equal(result, sendobj * comm.Get_size())
+
+
+@pytest.mark.skipif(
+    MPI is None, reason="mpi4py is not available or pytest was not run in parallel"
+)
+@pytest.mark.parametrize(
+    "sendobj", [np.array([True, False]), np.bool_(True), np.bool_(False)]
+)
+def test_mpi_comm_allreduce_sum_bool(sendobj):
+    result = MPIComm().allreduce(sendobj, ReductionOperator.SUM)
+    np.testing.assert_array_equal(result, sendobj)
+
+
+@pytest.mark.skipif(
+    MPI is None, reason="mpi4py is not available or pytest was not run in parallel"
+)
+def test_mpi_comm_allreduce_requires_operator():
+    with pytest.raises(TypeError):
+        MPIComm().allreduce(np.arange(5, dtype=np.float64))
+
+
+@pytest.mark.skipif(
+    MPI is None, reason="mpi4py is not available or pytest was not run in parallel"
+)
+@pytest.mark.parametrize("op", [ReductionOperator.REPLACE, ReductionOperator.NO_OP])
+@pytest.mark.parametrize("dtype", [np.float64, np.int32])
+def test_mpi_comm_allreduce_array_non_arithmetic(op, dtype):
+    sendobj = np.arange(5, dtype=dtype)
+    result = MPIComm().allreduce(sendobj, op)
+    np.testing.assert_array_equal(result, sendobj)
+
+
+@pytest.mark.skipif(
+    MPI is None, reason="mpi4py is not available or pytest was not run in parallel"
+)
+def test_mpi_comm_allreduce_array_logical():
+    comm = MPIComm()
+    sendobj = np.array([comm.Get_rank(), 1, 0], dtype=np.int32)
+    result = comm.allreduce(sendobj, ReductionOperator.LAND)
+    np.testing.assert_array_equal(result, [0, 1, 0])
+
+
+@pytest.mark.skipif(
+    MPI is None, reason="mpi4py is not available or pytest was not run in parallel"
+)
+@pytest.mark.parametrize(
+    "op",
+    [
+        ReductionOperator.LAND,
+        ReductionOperator.LOR,
+        ReductionOperator.LXOR,
+        ReductionOperator.REPLACE,
+        ReductionOperator.NO_OP,
+    ],
+)
+@pytest.mark.parametrize("sendobj", [np.float64(1.5), np.int32(3)])
+def test_mpi_comm_allreduce_scalar_non_arithmetic(op, sendobj):
+    comm = MPIComm()
+    expected = MPI.COMM_WORLD.allreduce(sendobj, MPIComm._op_mapping[op])
+    result = comm.allreduce(sendobj, op)
+    assert type(result) is type(expected)
+    assert result == expected
@@ -270,3 +270,15 @@ def test_to_data_array(quantity):
         assert (
             quantity.data_array.data.ctypes.data == quantity.data.ctypes.data
         ), "data memory address is not equal"
+
+
+def test_plot_k_level_saves_to_path(tmp_path):
+    pytest.importorskip("matplotlib")
+    quantity = Quantity(
+        np.random.randn(4, 3, 2),
+        dims=["dim1", "dim_2", "dimension_3"],
+        units="m",
+    )
+    path = tmp_path / "plot.png"
+    quantity.plot_k_level(1, path=path)
+    assert path.exists()
@@ -58,3 +58,24 @@ def test_boilerplate_import_orchestrated_cpu():
     )
 
     _copy_ops(stencil_factory, quantity_factory)
+
+
+def test_boilerplate_stencil_config_is_cached():
+    """Test that repeated boilerplate calls with the same options share the
+    stencil configuration, but not the mutable factories."""
+    from ndsl.boilerplate import get_factories_single_tile
+
+    factories = get_factories_single_tile(nx=5, ny=5, nz=2, nhalo=1)
+    other = get_factories_single_tile(nx=5, ny=5, nz=2, nhalo=1)
+    assert other.stencil_factory.config is factories.stencil_factory.config
+    assert other.stencil_factory is not factories.stencil_factory
+    assert other.quantity_factory is not factories.quantity_factory
+
+
+def test_boilerplate_extra_dims_do_not_leak():
+    from ndsl.boilerplate import get_factories_single_tile
+
+    _, quantity_factory = get_factories_single_tile(nx=5, ny=5, nz=2, nhalo=1)
+    quantity_factory.set_extra_dim_lengths(extra_dim=3)
+    _, other_quantity_factory = get_factories_single_tile(nx=5, ny=5, nz=2, nhalo=1)
+    assert "extra_dim" not in other_quantity_factory.sizer.extra_dim_lengths
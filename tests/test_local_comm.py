@@ -52,3 +52,13 @@ def test_local_comm_tags(local_communicator_list, tags):
                 recv = comm.Irecv(rec_buffer[i], source=(rank - 1) % size, tag=i)
                 recv.wait()
             assert (rec_buffer[list(tags)] == data - 1).all()
+
+
+def test_local_comm_send_copies_buffer(local_communicator_list):
+    sender, receiver = local_communicator_list
+    data = numpy.arange(4, dtype=numpy.float64)
+    sender.Send(data, dest=1)
+    data[:] = -1.0
+    recv_buffer = numpy.zeros(4)
+    receiver.Recv(recv_buffer, source=0)
+    numpy.testing.assert_array_equal(recv_buffer, numpy.arange(4))
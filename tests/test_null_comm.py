@@ -1,3 +1,5 @@
+import numpy as np
+
 from ndsl import (
     CubedSphereCommunicator,
     CubedSpherePartitioner,
@@ -14,3 +16,20 @@ def test_can_create_cube_communicator():
     partitioner = CubedSpherePartitioner(TilePartitioner(layout))
     communicator = CubedSphereCommunicator(mpi_comm, partitioner)
     communicator.tile.partitioner
+
+
+def test_null_comm_allgather_returns_copies():
+    comm = NullComm(rank=0, total_ranks=3)
+    data = np.arange(4.0)
+    gathered = comm.allgather(data)
+    assert len(gathered) == 3
+    gathered[0][:] = -1.0
+    np.testing.assert_array_equal(data, np.arange(4.0))
+    np.testing.assert_array_equal(gathered[1], np.arange(4.0))
+
+
+def test_null_comm_irecv_uses_fill_value():
+    comm = NullComm(rank=0, total_ranks=6, fill_value=3.0)
+    recv_buffer = np.zeros(4)
+    comm.Irecv(recv_buffer, source=1).wait()
+    np.testing.assert_array_equal(recv_buffer, 3.0)